@@ -0,0 +1,39 @@
+"""numeric helpers for the tick-decode path
+
+Signatures are declared at decoration time so numba compiles these on
+import — once, then straight from its on-disk cache on later runs —
+instead of paying the first-call compile inside a quote callback. When
+numba is not installed the plain-Python definitions are used as is.
+"""
+
+
+def compute_price_chg(close: float, prev_close: float) -> float:
+    return close - prev_close
+
+
+def compute_pct_chg(close: float, prev_close: float) -> float:
+    if prev_close == 0.0:
+        return 0.0
+    return (close - prev_close) / prev_close * 100.0
+
+
+def compute_avg_price(total_amount: float, total_volume: float) -> float:
+    if total_volume == 0.0:
+        return 0.0
+    return total_amount / total_volume
+
+
+try:
+    from numba import njit
+
+    compute_price_chg = njit(
+        "float64(float64, float64)", cache=True, fastmath=True
+    )(compute_price_chg)
+    compute_pct_chg = njit(
+        "float64(float64, float64)", cache=True, fastmath=True
+    )(compute_pct_chg)
+    compute_avg_price = njit(
+        "float64(float64, float64)", cache=True, fastmath=True
+    )(compute_avg_price)
+except ImportError:
+    pass
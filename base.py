@@ -1,16 +1,26 @@
 import typing
 from enum import Enum
 from pydantic import (
+    VERSION as PYDANTIC_VERSION,
     BaseModel,
     conint,
     StrictInt,
     constr,
 )
 
-# _missing = object()
+_pydantic_version_info = tuple(int(part) for part in PYDANTIC_VERSION.split(".")[:2])
+PYDANTIC_V2 = _pydantic_version_info >= (2, 0)
+
+_missing = object()
 
 
 class BaseModelV10(BaseModel):
+    _allowed_keys: typing.FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._allowed_keys = frozenset(cls.__fields__)
+
     def __repr_args__(self):
         return [(k, v) for k, v in self._iter(to_dict=False, exclude_defaults=True)]
 
@@ -25,12 +35,11 @@ class BaseModelV10(BaseModel):
         exclude_defaults: bool = False,
         # exclude_none: bool = False,
     ):
-        if not to_dict:
-            if allowed_keys is None:
-                allowed_keys = set(self.__fields__)
+        if not to_dict and allowed_keys is None:
             if exclude:
-                for k in exclude:
-                    allowed_keys.discard(k)
+                allowed_keys = self._allowed_keys - set(exclude)
+            else:
+                allowed_keys = self._allowed_keys
         return super()._iter(
             to_dict,
             by_alias,
@@ -83,11 +92,13 @@ class BaseModelV10(BaseModel):
         )
 
     def lazy_setter(self, **kwargs):
-        [
-            setattr(self, kwarg, value)
-            for kwarg, value in kwargs.items()
-            if hasattr(self, kwarg)
-        ]
+        for kwarg in kwargs.keys() & self.__fields__.keys():
+            setattr(self, kwarg, kwargs[kwarg])
+
+    @classmethod
+    def from_trusted(cls, **fields):
+        """build without validation from an already type-checked source"""
+        return cls.construct(**fields)
 
 
 class BaseModelV15(BaseModel):
@@ -135,68 +146,99 @@ class BaseModelV15(BaseModel):
         )
 
     def lazy_setter(self, **kwargs):
-        [
-            setattr(self, kwarg, value)
-            for kwarg, value in kwargs.items()
-            if hasattr(self, kwarg)
-        ]
+        for kwarg in kwargs.keys() & self.__fields__.keys():
+            setattr(self, kwarg, kwargs[kwarg])
+
+    @classmethod
+    def from_trusted(cls, **fields):
+        """build without validation from an already type-checked source"""
+        return cls.construct(**fields)
 
 
 class BaseModelV20(BaseModel):
-    __json__: dict = {}
+    __json__: typing.Optional[dict] = None
+    _defaults_snapshot: typing.ClassVar[dict] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._defaults_snapshot = {
+            name: field.get_default(call_default_factory=False)
+            for name, field in cls.model_fields.items()
+            if not field.is_required()
+        }
 
     def __repr_args__(self):
+        fields = type(self).model_fields
+        defaults = type(self)._defaults_snapshot
+        fields_set = self.model_fields_set
         return [
-            (k, getattr(self, k))
-            for k, v in self.model_dump(exclude_defaults=True).items()
+            (k, v)
+            for k, v in self.__dict__.items()
+            if k in fields
+            and (k in fields_set or v != defaults.get(k, _missing))
         ]
 
-    def keys(self) -> typing.Set[str]:  # typing.List[typing.Any]:
-        if not self.__json__:
-            self.__json__ = self.model_dump(
-                mode="json",
-                by_alias=False,
-                include=None,
-                exclude=None,
-                exclude_unset=True,
-                exclude_defaults=True,
-                exclude_none=True,
+    def _dump_json_cache(self) -> dict:
+        if self.__json__ is None:
+            object.__setattr__(
+                self,
+                "__json__",
+                self.__pydantic_serializer__.to_python(
+                    self,
+                    mode="json",
+                    by_alias=False,
+                    exclude_unset=True,
+                    exclude_defaults=True,
+                    exclude_none=True,
+                ),
             )
-        return self.__json__.keys()
+        return self.__json__
+
+    def keys(self) -> typing.Set[str]:  # typing.List[typing.Any]:
+        return self._dump_json_cache().keys()
 
     def __getitem__(self, key: str) -> typing.Any:
-        if not self.__json__:
-            self.__json__ = self.model_dump(
-                mode="json",
-                by_alias=False,
-                include=None,
-                exclude=None,
-                exclude_unset=True,
-                exclude_defaults=True,
-                exclude_none=True,
-            )
-        return self.__json__[key]
+        return self._dump_json_cache()[key]
 
     def lazy_setter(self, **kwargs):
-        [
-            setattr(self, kwarg, value)
-            for kwarg, value in kwargs.items()
-            if hasattr(self, kwarg)
-        ]
+        settable = kwargs.keys() & type(self).model_fields.keys()
+        if not settable:
+            return
+        for kwarg in settable:
+            object.__setattr__(self, kwarg, kwargs[kwarg])
+        self.__pydantic_fields_set__.update(settable)
+        self._clean_cache()
+
+    @classmethod
+    def from_trusted(cls, **fields):
+        """build without validation from an already type-checked source"""
+        return cls.model_construct(**fields)
 
     def _clean_cache(self):
-        if self.__json__:
-            object.__setattr__(self, "__json__", {})
+        if self.__json__ is not None:
+            object.__setattr__(self, "__json__", None)
 
     def __setattr__(self, name: str, value: typing.Any) -> None:
-        self._clean_cache()
+        # skip the cache flush when a scalar is rewritten with an equal
+        # value; the == probe is limited to plain scalars because array
+        # fields compare element-wise and are not usefully comparable here
+        current = self.__dict__.get(name, _missing)
+        if not (
+            current is value
+            or (
+                isinstance(value, (int, float, str))
+                and current.__class__ is value.__class__
+                and current == value
+            )
+        ):
+            self._clean_cache()
         return super().__setattr__(name, value)
 
     def dict(self):
-        return self.model_dump(
+        return self.__pydantic_serializer__.to_python(
+            self,
             mode="json",
-            include=None,
-            exclude=None,
             by_alias=False,
             exclude_unset=False,
             exclude_defaults=False,
@@ -215,14 +257,52 @@ class BaseProps(metaclass=MetaProps):
     pass
 
 
-from importlib_metadata import version
+# branchless range check for printable ascii ("^[ -~]*$"): all lanes are
+# < 0x80 after the ascii encode, so only bytes below 0x20 (control chars)
+# and 0x7F (DEL) can remain invalid.
+_SWAR_HIGH = 0x8080808080808080
+_SWAR_SPACE = 0x2020202020202020
+_SWAR_DEL = 0x7F7F7F7F7F7F7F7F
+_SWAR_ONE = 0x0101010101010101
+
+
+def _validate_ascii_max6(value: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError("Input should be a valid string")
+    if len(value) > 6:
+        raise ValueError("String should have at most 6 characters")
+    if not value:
+        return value
+    packed = int.from_bytes(value.encode("ascii").ljust(8, b" "), "little")
+    below_space = ~((packed | _SWAR_HIGH) - _SWAR_SPACE) & _SWAR_HIGH
+    xor_del = packed ^ _SWAR_DEL
+    is_del = (xor_del - _SWAR_ONE) & ~xor_del & _SWAR_HIGH
+    if below_space | is_del:
+        raise ValueError("String should match pattern '^[ -~]*$'")
+    return value
+
+
+if PYDANTIC_V2:
+    from pydantic import BeforeValidator, ConfigDict
 
-if version("pydantic") >= "2.0":
     BaseModel = BaseModelV20
-    ConStrAsciiMax6 = constr(max_length=6, pattern="^[ -~]*$")
-elif version("pydantic") > "1.0":
+    ConStrAsciiMax6 = typing.Annotated[str, BeforeValidator(_validate_ascii_max6)]
+
+    class FrozenModel(BaseModelV20):
+        model_config = ConfigDict(frozen=True)
+
+elif _pydantic_version_info > (1, 0):
     BaseModel = BaseModelV15
     ConStrAsciiMax6 = constr(max_length=6, regex="^[ -~]*$")
+
+    class FrozenModel(BaseModelV15):
+        class Config:
+            allow_mutation = False
+
 else:
     BaseModel = BaseModelV10
     ConStrAsciiMax6 = constr(max_length=6, regex="^[ -~]*$")
+
+    class FrozenModel(BaseModelV10):
+        class Config:
+            allow_mutation = False
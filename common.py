@@ -1,13 +1,21 @@
-from typing import Optional
+import typing
+
+import orjson
+
 from shioaji.account import BaseAccount
 from shioaji.base import BaseModel
 
 
 class TraceLog(BaseModel):
     person_id: str
-    account: Optional[BaseAccount]
+    account: typing.Optional[BaseAccount]
     ip: str
     action: str
     func: str
-    func_content: dict
+    func_content: typing.Union[bytes, dict]
     result: str
+
+    def func_content_dict(self) -> dict:
+        if isinstance(self.func_content, bytes):
+            return orjson.loads(self.func_content)
+        return self.func_content
@@ -1,52 +1,53 @@
 from enum import Enum
-
-ACTION_BUY = "Buy"
-ACTION_SELL = "Sell"
-
-STOCK_PRICE_TYPE_LIMITPRICE = "LMT"
-STOCK_PRICE_TYPE_MKT = "MKT"
-STOCK_PRICE_TYPE_CLOSE = "Close"
-
-STOCK_ORDER_LOT_COMMON = "Common"  # 整股
-STOCK_ORDER_LOT_BLOCKTRADE = "BlockTrade"  # 鉅額
-STOCK_ORDER_LOT_FIXING = "Fixing"  # 定盤
-STOCK_ORDER_LOT_ODD = "Odd"  # 零股
-STOCK_ORDER_LOT_INTRADAY_ODD = "IntradayOdd"  # 零股
-
-STOCK_ORDER_TYPE_COMMON = "Common"  # 整股
-STOCK_ORDER_TYPE_BLOCKTRADE = "BlockTrade"  # 鉅額
-STOCK_ORDER_TYPE_FIXING = "Fixing"  # 定盤
-STOCK_ORDER_TYPE_ODD = "Odd"  # 零股
-
-STOCK_ORDER_COND_CASH = "Cash"  # 現股
-STOCK_ORDER_COND_NETTING = "Netting"  # 餘額交割
-STOCK_ORDER_COND_MARGINTRADING = "MarginTrading"  # 融資
-STOCK_ORDER_COND_SHORTSELLING = "ShortSelling"  # 融券
-STOCK_ORDER_COND_EMERGING = "Emerging"  # 興櫃
-
-STOCK_FIRST_SELL_YES = "true"
-STOCK_FIRST_SELL_NO = "false"
-
-FUTURES_PRICE_TYPE_LMT = "LMT"
-FUTURES_PRICE_TYPE_MKT = "MKT"
-FUTURES_PRICE_TYPE_MKP = "MKP"
-
-ORDER_TYPE_ROD = "ROD"
-ORDER_TYPE_IOC = "IOC"
-ORDER_TYPE_FOK = "FOK"
-
-FUTURES_OCTYPE_AUTO = "Auto"
-FUTURES_OCTYPE_NEWPOSITION = "New"
-FUTURES_OCTYPE_COVER = "Cover"
-FUTURES_OCTYPE_DAYTRADE = "DayTrade"
-
-FUTURES_CALLPUT_FUT = "F"
-FUTURES_CALLPUT_CALL = "C"
-FUTURES_CALLPUT_PUT = "P"
-
-QUOTE_TYPE_TICK = "tick"
-QUOTE_TYPE_BIDASK = "bidask"
-QUOTE_TYPE_QUOTE = "quote"
+from sys import intern
+
+ACTION_BUY = intern("Buy")
+ACTION_SELL = intern("Sell")
+
+STOCK_PRICE_TYPE_LIMITPRICE = intern("LMT")
+STOCK_PRICE_TYPE_MKT = intern("MKT")
+STOCK_PRICE_TYPE_CLOSE = intern("Close")
+
+STOCK_ORDER_LOT_COMMON = intern("Common")  # 整股
+STOCK_ORDER_LOT_BLOCKTRADE = intern("BlockTrade")  # 鉅額
+STOCK_ORDER_LOT_FIXING = intern("Fixing")  # 定盤
+STOCK_ORDER_LOT_ODD = intern("Odd")  # 零股
+STOCK_ORDER_LOT_INTRADAY_ODD = intern("IntradayOdd")  # 零股
+
+STOCK_ORDER_TYPE_COMMON = intern("Common")  # 整股
+STOCK_ORDER_TYPE_BLOCKTRADE = intern("BlockTrade")  # 鉅額
+STOCK_ORDER_TYPE_FIXING = intern("Fixing")  # 定盤
+STOCK_ORDER_TYPE_ODD = intern("Odd")  # 零股
+
+STOCK_ORDER_COND_CASH = intern("Cash")  # 現股
+STOCK_ORDER_COND_NETTING = intern("Netting")  # 餘額交割
+STOCK_ORDER_COND_MARGINTRADING = intern("MarginTrading")  # 融資
+STOCK_ORDER_COND_SHORTSELLING = intern("ShortSelling")  # 融券
+STOCK_ORDER_COND_EMERGING = intern("Emerging")  # 興櫃
+
+STOCK_FIRST_SELL_YES = intern("true")
+STOCK_FIRST_SELL_NO = intern("false")
+
+FUTURES_PRICE_TYPE_LMT = intern("LMT")
+FUTURES_PRICE_TYPE_MKT = intern("MKT")
+FUTURES_PRICE_TYPE_MKP = intern("MKP")
+
+ORDER_TYPE_ROD = intern("ROD")
+ORDER_TYPE_IOC = intern("IOC")
+ORDER_TYPE_FOK = intern("FOK")
+
+FUTURES_OCTYPE_AUTO = intern("Auto")
+FUTURES_OCTYPE_NEWPOSITION = intern("New")
+FUTURES_OCTYPE_COVER = intern("Cover")
+FUTURES_OCTYPE_DAYTRADE = intern("DayTrade")
+
+FUTURES_CALLPUT_FUT = intern("F")
+FUTURES_CALLPUT_CALL = intern("C")
+FUTURES_CALLPUT_PUT = intern("P")
+
+QUOTE_TYPE_TICK = intern("tick")
+QUOTE_TYPE_BIDASK = intern("bidask")
+QUOTE_TYPE_QUOTE = intern("quote")
 
 
 class Action(str, Enum):
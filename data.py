@@ -2,23 +2,63 @@ import typing
 import datetime
 from collections import abc
 
+import numpy as np
 from pydantic import validator
-from shioaji.base import BaseModel
+from shioaji.base import BaseModel, FrozenModel, PYDANTIC_V2
 from shioaji.constant import ChangeType, TickType, Exchange
 
+if PYDANTIC_V2:
+    from pydantic import PlainSerializer, PlainValidator
 
-class Ticks(BaseModel):
-    ts: typing.List[int]
-    close: typing.List[float]
-    volume: typing.List[int]
-    bid_price: typing.List[float]
-    bid_volume: typing.List[int]
-    ask_price: typing.List[float]
-    ask_volume: typing.List[int]
-    tick_type: typing.List[int]
+    def _ndarray_column(dtype) -> typing.Any:
+        return typing.Annotated[
+            np.ndarray,
+            PlainValidator(lambda v: np.asarray(v, dtype=dtype)),
+            PlainSerializer(lambda v: v.tolist(), return_type=list),
+        ]
+
+    IntColumn = _ndarray_column(np.int64)
+    FloatColumn = _ndarray_column(np.float64)
+else:
+    IntColumn = typing.List[int]
+    FloatColumn = typing.List[float]
+
+
+def _vwap(price, volume):
+    cum_amount = np.cumsum(price * volume)
+    cum_volume = np.cumsum(volume)
+    return cum_amount / np.maximum(cum_volume, 1)
+
+
+try:
+    from numba import njit
 
+    _vwap = njit(
+        "float64[:](float64[:], float64[:])", cache=True, fastmath=True
+    )(_vwap)
+except ImportError:
+    pass
 
-class Snapshot(BaseModel):
+
+class Ticks(BaseModel):
+    ts: IntColumn
+    close: FloatColumn
+    volume: IntColumn
+    bid_price: FloatColumn
+    bid_volume: IntColumn
+    ask_price: FloatColumn
+    ask_volume: IntColumn
+    tick_type: IntColumn
+
+    def vwap(self) -> np.ndarray:
+        """running volume-weighted average price over the tick series"""
+        return _vwap(
+            np.asarray(self.close, np.float64),
+            np.asarray(self.volume, np.float64),
+        )
+
+
+class Snapshot(FrozenModel):
     ts: int
     code: str
     exchange: str
@@ -43,6 +83,49 @@ class Snapshot(BaseModel):
     volume_ratio: float
 
 
+SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("ts", "i8"),
+        ("code", "U10"),
+        ("exchange", "U8"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("change_price", "f8"),
+        ("change_rate", "f8"),
+        ("average_price", "f8"),
+        ("volume", "i8"),
+        ("total_volume", "i8"),
+        ("amount", "i8"),
+        ("total_amount", "i8"),
+        ("yesterday_volume", "f8"),
+        ("buy_price", "f8"),
+        ("buy_volume", "f8"),
+        ("sell_price", "f8"),
+        ("sell_volume", "i8"),
+        ("volume_ratio", "f8"),
+    ]
+)
+
+
+def snapshots_to_array(snapshots: typing.List[Snapshot]) -> np.ndarray:
+    """pack snapshots into one structured array row per contract
+
+    Column access (``arr["close"]``) then walks contiguous memory instead
+    of a Python attribute lookup per snapshot, and ``pd.DataFrame(arr)``
+    is zero-copy. The enum-valued ``tick_type``/``change_type`` fields are
+    left out since they have no numeric lane.
+    """
+    arr = np.zeros(len(snapshots), dtype=SNAPSHOT_DTYPE)
+    names = SNAPSHOT_DTYPE.names
+    for idx, snapshot in enumerate(snapshots):
+        row = arr[idx]
+        for name in names:
+            row[name] = getattr(snapshot, name)
+    return arr
+
+
 class CreditEnquire(BaseModel):
     update_time: str = ""
     system: str = ""
@@ -58,28 +141,34 @@ class ShortStockSource(BaseModel):
 
 
 class Kbars(BaseModel):
-    ts: typing.List[int]
-    Open: typing.List[float]
-    High: typing.List[float]
-    Low: typing.List[float]
-    Close: typing.List[float]
-    Volume: typing.List[int]
-    Amount: typing.List[float]
+    ts: IntColumn
+    Open: FloatColumn
+    High: FloatColumn
+    Low: FloatColumn
+    Close: FloatColumn
+    Volume: IntColumn
+    Amount: FloatColumn
+
+    def vwap(self) -> np.ndarray:
+        """running volume-weighted average price over the kbar series"""
+        cum_amount = np.cumsum(np.asarray(self.Amount, np.float64))
+        cum_volume = np.cumsum(np.asarray(self.Volume, np.float64))
+        return cum_amount / np.maximum(cum_volume, 1)
 
 
 class DailyQuotes(BaseModel):
     Date: typing.List[datetime.date]
     Code: typing.List[str]
-    Open: typing.List[float]
-    High: typing.List[float]
-    Low: typing.List[float]
-    Close: typing.List[float]
-    Volume: typing.List[int]
-    Transaction: typing.List[int]
-    Amount: typing.List[int]
+    Open: FloatColumn
+    High: FloatColumn
+    Low: FloatColumn
+    Close: FloatColumn
+    Volume: IntColumn
+    Transaction: IntColumn
+    Amount: IntColumn
 
 
-class ScannerItem(BaseModel):
+class ScannerItem(FrozenModel):
     date: str
     code: str
     name: str
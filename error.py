@@ -5,11 +5,13 @@ from shioaji.contracts import Contract
 
 class BaseError(Exception):
     def __init__(self, code, message):
-        formated_mes = "StatusCode: {}, Detail: {}".format(code, message)
-        super().__init__(formated_mes)
+        super().__init__(code, message)
         self.code = code
         self.message = message
 
+    def __str__(self) -> str:
+        return "StatusCode: {}, Detail: {}".format(self.code, self.message)
+
 
 class TokenError(BaseError):
     """Raise when token error."""
@@ -23,20 +25,28 @@ class TimeoutError(BaseError):
     """Timeout Error"""
 
     def __init__(self, topic: str, extra_info: dict):
-        formated_mes = "Timeout 408 Topic: {}, ExtraInfo: {}".format(topic, extra_info)
-        super().__init__("408", formated_mes)
+        Exception.__init__(self, topic, extra_info)
+        self.code = "408"
         self.topic = topic
         self.extra_info = extra_info
 
+    @property
+    def message(self) -> str:
+        return "Timeout 408 Topic: {}, ExtraInfo: {}".format(
+            self.topic, self.extra_info
+        )
+
 
 class AccountError(Exception):
     """Account Error"""
 
     def __init__(self, account: Account):
-        message = "{} Account({})".format(self.__class__.__name__, account)
-        super().__init__(message)
+        super().__init__(account)
         self.account = account
 
+    def __str__(self) -> str:
+        return "{} Account({})".format(self.__class__.__name__, self.account)
+
 
 class AccountNotSignError(AccountError):
     """Account not sign"""
@@ -53,9 +63,12 @@ class ContractError(Exception):
     """Contract Error"""
 
     def __init__(self, contract: Contract, message: str):
+        super().__init__(contract, message)
         self.contract = contract
-        message = "Contract({})\n{}".format(contract, message)
-        super().__init__(message)
+        self.message = message
+
+    def __str__(self) -> str:
+        return "Contract({})\n{}".format(self.contract, self.message)
 
 
 class TargetContractNotExistError(ContractError):
@@ -1,8 +1,17 @@
+import functools
 import typing
 import datetime
 
-from shioaji.base import BaseModel, conint, StrictInt, ConStrAsciiMax6
+from shioaji.base import (
+    PYDANTIC_V2,
+    BaseModel,
+    FrozenModel,
+    conint,
+    StrictInt,
+    ConStrAsciiMax6,
+)
 from shioaji.account import Account
+from shioaji.data import FloatColumn, IntColumn
 from shioaji.contracts import Contract, ComboContract
 from shioaji.constant import (
     Action,
@@ -17,13 +26,40 @@ from shioaji.constant import (
 )
 
 
-class Deal(BaseModel):
+class Deal(FrozenModel):
     seq: str
-    price: typing.Union[StrictInt, float]
+    price: float
     quantity: int
     ts: float
 
 
+class DealTable(BaseModel):
+    """struct-of-arrays layout over deals for vectorized aggregation"""
+
+    seq: typing.List[str]
+    price: FloatColumn
+    quantity: IntColumn
+    ts: FloatColumn
+
+    @classmethod
+    def from_deals(cls, deals: typing.List[Deal]) -> "DealTable":
+        return cls(
+            seq=[deal.seq for deal in deals],
+            price=[deal.price for deal in deals],
+            quantity=[deal.quantity for deal in deals],
+            ts=[deal.ts for deal in deals],
+        )
+
+    def __len__(self) -> int:
+        return len(self.seq)
+
+    def __iter__(self) -> typing.Iterator[Deal]:
+        for seq, price, quantity, ts in zip(
+            self.seq, self.price, self.quantity, self.ts
+        ):
+            yield Deal(seq=seq, price=float(price), quantity=int(quantity), ts=float(ts))
+
+
 class OrderStatus(BaseModel):
     id: str = ""
     status: Status
@@ -38,6 +74,17 @@ class OrderStatus(BaseModel):
     cancel_quantity: int = 0
     deals: typing.List[Deal] = None
 
+    def apply_update(self, **changes) -> "OrderStatus":
+        """copy the status with changes applied, skipping re-validation
+
+        Exchange updates arrive as already-validated scalars, so a
+        shallow model_copy is enough and leaves the original visible to
+        concurrent readers.
+        """
+        if PYDANTIC_V2:
+            return self.model_copy(update=changes)
+        return self.copy(update=changes)
+
 
 class ComboStatus(OrderStatus):
     deals: typing.Dict[str, typing.List[Deal]] = None
@@ -55,10 +102,7 @@ class BaseOrder(BaseModel):
     ca: str = ""
 
     def __repr_args__(self):
-        return [
-            (k, v)
-            for k, v in self._iter(to_dict=False, exclude_defaults=True, exclude={"ca"})
-        ]
+        return [(k, v) for k, v in super().__repr_args__() if k != "ca"]
 
 
 class FuturesOrder(BaseOrder):
@@ -89,16 +133,12 @@ class Order(StockOrder, FuturesOrder):
         **kwargs
     ):
         super().__init__(
-            **{
-                **dict(
-                    price=price,
-                    quantity=quantity,
-                    action=action,
-                    price_type=price_type,
-                    order_type=order_type,
-                ),
-                **kwargs,
-            }
+            price=price,
+            quantity=quantity,
+            action=action,
+            price_type=price_type,
+            order_type=order_type,
+            **kwargs
         )
 
 
@@ -115,27 +155,52 @@ class ComboOrder(FuturesOrder):
         **kwargs
     ):
         super().__init__(
-            **{
-                **dict(
-                    price=price,
-                    quantity=quantity,
-                    action=action,
-                    price_type=price_type,
-                    order_type=order_type,
-                ),
-                **kwargs,
-            }
+            price=price,
+            quantity=quantity,
+            action=action,
+            price_type=price_type,
+            order_type=order_type,
+            **kwargs
         )
 
 OrderTypeVar = typing.Union[Order, StockOrder, FuturesOrder]
 
+if PYDANTIC_V2:
+    from pydantic import TypeAdapter
+
+    @functools.lru_cache(maxsize=1)
+    def _order_type_adapter() -> "TypeAdapter":
+        return TypeAdapter(OrderTypeVar)
+
+
+def _construct_trade(trade, contract, order, status):
+    object.__setattr__(
+        trade, "__dict__", dict(contract=contract, order=order, status=status)
+    )
+    object.__setattr__(
+        trade, "__pydantic_fields_set__", {"contract", "order", "status"}
+    )
+    object.__setattr__(trade, "__pydantic_extra__", None)
+    object.__setattr__(trade, "__pydantic_private__", None)
+
+
 class Trade(BaseModel):
     contract: Contract
     order: OrderTypeVar
     status: OrderStatus
 
     def __init__(self, contract: Contract, order: OrderTypeVar, status: OrderStatus):
-        super().__init__(**dict(contract=contract, order=order, status=status))
+        if (
+            PYDANTIC_V2
+            and isinstance(contract, Contract)
+            and isinstance(order, (Order, StockOrder, FuturesOrder))
+            and isinstance(status, OrderStatus)
+        ):
+            _construct_trade(self, contract, order, status)
+        else:
+            if PYDANTIC_V2 and isinstance(order, dict):
+                order = _order_type_adapter().validate_python(order)
+            super().__init__(**dict(contract=contract, order=order, status=status))
 
 
 class ComboTrade(BaseModel):
@@ -144,7 +209,17 @@ class ComboTrade(BaseModel):
     status: ComboStatus
 
     def __init__(self, contract: ComboContract, order: OrderTypeVar, status: ComboStatus):
-        super().__init__(**dict(contract=contract, order=order, status=status))
+        if (
+            PYDANTIC_V2
+            and isinstance(contract, ComboContract)
+            and isinstance(order, (Order, StockOrder, FuturesOrder))
+            and isinstance(status, ComboStatus)
+        ):
+            _construct_trade(self, contract, order, status)
+        else:
+            if PYDANTIC_V2 and isinstance(order, dict):
+                order = _order_type_adapter().validate_python(order)
+            super().__init__(**dict(contract=contract, order=order, status=status))
 
 
 class OrderDealRecords(BaseModel):
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
 import abc
+import functools
+import threading
+import time
 import typing
 import datetime as dt
-from sentry_sdk import configure_scope
+from sys import intern
+from concurrent.futures import ThreadPoolExecutor
 
 from shioaji.account import Account, AccountType, FutureAccount, StockAccount
 from shioaji.backend.solace.utils import (
@@ -16,10 +22,12 @@ from shioaji.backend.solace.bidask import BidAskSTKv1, BidAskFOPv1
 from shioaji.backend.solace.quote import QuoteSTKv1
 from shioaji.constant import (
     Action,
+    ChangeType,
     Exchange,
     OrderState,
     SecurityType,
     Status,
+    TickType,
     Unit,
     ScannerType,
     TicksQueryType,
@@ -53,23 +61,29 @@ from shioaji.position import (
     FutureProfitLossSummary,
     StockProfitLossSummary,
 )
-from shioaji.data import (
-    DailyQuotes,
-    ShortStockSource,
-    Snapshot,
-    Ticks,
-    Kbars,
-    CreditEnquire,
-    ScannerItem,
-    UsageStatus,
-)
-from shioaji.reserve import (
-    EarmarkStocksDetailResponse,
-    ReserveEarmarkingResponse,
-    ReserveStockResponse,
-    ReserveStocksDetailResponse,
-    ReserveStocksSummaryResponse,
-)
+if typing.TYPE_CHECKING:
+    # annotation-only imports. Deferring shioaji.reserve skips its tree of
+    # response models at import; shioaji.data still loads eagerly through
+    # shioaji.order's column types, so for it this only keeps the names
+    # out of the runtime namespace (the module __getattr__ below restores
+    # them for from-imports).
+    from shioaji.data import (
+        DailyQuotes,
+        ShortStockSource,
+        Snapshot,
+        Ticks,
+        Kbars,
+        CreditEnquire,
+        ScannerItem,
+        UsageStatus,
+    )
+    from shioaji.reserve import (
+        EarmarkStocksDetailResponse,
+        ReserveEarmarkingResponse,
+        ReserveStockResponse,
+        ReserveStocksDetailResponse,
+        ReserveStocksSummaryResponse,
+    )
 from shioaji.order import (
     ComboOrder,
     Order,
@@ -85,6 +99,8 @@ from shioaji.utils import (
     set_error_tracking,
     check_contract_cache,
     clear_outdated_contract_cache,
+    read_contract_version,
+    write_contract_version,
     LEGACY_TEST,
 )
 from shioaji.error import (
@@ -94,6 +110,154 @@ from shioaji.error import (
 )
 
 
+_LAZY_IMPORTS = {
+    "DailyQuotes": "shioaji.data",
+    "ShortStockSource": "shioaji.data",
+    "Snapshot": "shioaji.data",
+    "Ticks": "shioaji.data",
+    "Kbars": "shioaji.data",
+    "CreditEnquire": "shioaji.data",
+    "ScannerItem": "shioaji.data",
+    "UsageStatus": "shioaji.data",
+    "EarmarkStocksDetailResponse": "shioaji.reserve",
+    "ReserveEarmarkingResponse": "shioaji.reserve",
+    "ReserveStockResponse": "shioaji.reserve",
+    "ReserveStocksDetailResponse": "shioaji.reserve",
+    "ReserveStocksSummaryResponse": "shioaji.reserve",
+}
+
+
+def __getattr__(name):
+    """PEP 562 fallback so the deferred names stay importable at runtime"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+_SECURITY_TYPES = tuple(SecurityType)
+
+# wire-ready (quote_type, version) string pairs for the common subscribe
+# paths, so per-call dispatch keys on a precomputed tuple instead of two
+# enum .value reads per contract during bulk subscribes
+_QT_TICK_V1 = (QuoteType.Tick.value, QuoteVersion.v1.value)
+_QT_BIDASK_V1 = (QuoteType.BidAsk.value, QuoteVersion.v1.value)
+_QT_QUOTE_V1 = (QuoteType.Quote.value, QuoteVersion.v1.value)
+_QUOTE_WIRE_CODES = {
+    (QuoteType.Tick, QuoteVersion.v1): _QT_TICK_V1,
+    (QuoteType.BidAsk, QuoteVersion.v1): _QT_BIDASK_V1,
+    (QuoteType.Quote, QuoteVersion.v1): _QT_QUOTE_V1,
+}
+
+
+# a cached push older than this is treated as a miss: once a code stops
+# streaming (unsubscribe, session teardown) its entry ages out instead of
+# serving yesterday's tick forever
+_LIVE_SNAPSHOT_TTL = 60.0
+
+# wire int -> enum tables for building snapshots out of stream pushes
+_TICK_TYPES = (TickType.No, TickType.Buy, TickType.Sell)
+_CHANGE_TYPES = (
+    ChangeType.Unchanged,  # 0 is unused on the wire, keep a safe fallback
+    ChangeType.LimitUp,
+    ChangeType.Up,
+    ChangeType.Unchanged,
+    ChangeType.Down,
+    ChangeType.LimitDown,
+)
+
+
+def _trade_match(trade, status: Status, account: Account) -> bool:
+    if status is not None and trade.status.status != status:
+        return False
+    if account is not None:
+        trade_account = trade.order.account
+        if (
+            trade_account is None
+            or trade_account.broker_id != account.broker_id
+            or trade_account.account_id != account.account_id
+        ):
+            return False
+    return True
+
+
+def _batch_stream_callback(record, func, batch: int, coalesce_us: int):
+    """coalesce per-message pushes into one ``func(..., [msg, ...])`` call
+
+    Messages are buffered per prefix args (the exchange, plus the bound
+    context if any), so a stream mixing TSE/OTC pushes never delivers a
+    batch under the wrong exchange label. A prefix's buffer flushes when
+    it holds ``batch`` messages, or from a one-shot timer armed by the
+    first message of the batch once ``coalesce_us`` elapses — the tail of
+    a burst is delivered within the window even if no further push ever
+    arrives.
+    """
+    if batch > 1 and coalesce_us <= 0:
+        raise ValueError(
+            "batch > 1 requires coalesce_us > 0, otherwise the tail of a "
+            "burst is never flushed"
+        )
+    buffers = {}  # prefix args -> [messages, pending flush timer]
+    lock = threading.Lock()
+    coalesce_seconds = coalesce_us / 1e6
+
+    def flush(prefix):
+        with lock:
+            entry = buffers.get(prefix)
+            if entry is None or not entry[0]:
+                return
+            pending = entry[0]
+            entry[0] = []
+            entry[1] = None
+        func(*prefix, pending)
+
+    @functools.wraps(func)
+    def accumulate(*args):
+        if record is not None:
+            record(*args)
+        prefix = args[:-1]
+        full = None
+        with lock:
+            entry = buffers.get(prefix)
+            if entry is None:
+                entry = buffers[prefix] = [[], None]
+            pending = entry[0]
+            pending.append(args[-1])
+            if len(pending) >= batch:
+                entry[0] = []
+                if entry[1] is not None:
+                    entry[1].cancel()
+                    entry[1] = None
+                full = pending
+            elif len(pending) == 1:
+                timer = threading.Timer(coalesce_seconds, flush, (prefix,))
+                timer.daemon = True
+                timer.start()
+                entry[1] = timer
+        if full is not None:
+            func(*prefix, full)
+
+    return accumulate
+
+
+def require_signed(func):
+    """raise AccountNotSignError before the RPC when the account is unsigned"""
+
+    @functools.wraps(func)
+    def wrapper(self, account, *args, **kwargs):
+        if not account.signed:
+            raise AccountNotSignError(account)
+        return func(self, account, *args, **kwargs)
+
+    return wrapper
+
+
 class Quote:
     @abc.abstractmethod
     def subscribe(
@@ -202,12 +366,26 @@ class Shioaji:
         """
 
         self.quote: Quote
-        self.stock_account = None
-        self.futopt_account = None
+        self._default_account_map = {}
+        self._io_pool = None
+        self._today_ordinal = -1
+        self._today_str = ""
+        # trace-log gate as a bool table: one subscript instead of an
+        # integer compare per call, and a single place to tune the cutoff
+        self._trace_log_hours = tuple(hour < 12 for hour in range(24))
+        # latest stream push per code, fed by the on_tick/on_bidask
+        # decorators so snapshots() can skip the RPC for subscribed codes
+        self._live_ticks = {}
+        self._live_bidasks = {}
         self.OrderProps = OrderProps
         self.Order = Order
         self.ComboOrder = ComboOrder
         self._currency = currency
+        self._accounts_cache = []
+        self._target_code_index = {}
+        # bumped whenever contracts are refetched; combos resolved under an
+        # older epoch get their legs re-resolved on the next submit
+        self._contracts_epoch = 0
         self.simulation = simulation
         self.proxies = proxies
         self.vpn = vpn
@@ -235,22 +413,38 @@ class Shioaji:
             self._solace.activated_ca = mockca()
 
         self.quote = self._solace
+        # bound-method aliases: sj.subscribe(...) costs one attribute hop
+        # instead of walking through sj.quote on every market-data subscribe
+        self.subscribe = self._solace.subscribe
+        self.unsubscribe = self._solace.unsubscribe
+        # same treatment for the pure pass-through RPCs: the instance
+        # attribute shadows the def below, skipping one Python frame per
+        # call while the def keeps the documented signature
+        self.usage = self._solace.usage
+        self.credit_enquires = self._solace.credit_enquires
+        self.short_stock_sources = self._solace.short_stock_sources
+        self.order_deal_records = self._solace.order_deal_records
+        self.set_order_callback = self._solace.set_order_callback
+        self.set_session_down_callback = self._solace.set_session_down_callback
+        self.set_context = self._solace.set_context
 
     def _trace_log(self, trade: Trade):
         if not self.simulation:
             return
-        if dt.datetime.utcnow().weekday() >= 5:
-            return
-        elif dt.datetime.utcnow().hour >= 12:
+        utcnow = dt.datetime.utcnow()
+        if utcnow.weekday() >= 5 or not self._trace_log_hours[utcnow.hour]:
             return
 
         if not self._simu_to_stag:
-            accounts = [
-                acc
-                for acc in self._solace.list_accounts()
-                if acc.account_type == trade.order.account.account_type
-            ]
-            not_signed = any([not acc.signed for acc in accounts])
+            all_accounts = self._accounts_cache
+            if not all_accounts:
+                all_accounts = self._accounts_cache = self._solace.list_accounts()
+            account_type = trade.order.account.account_type
+            not_signed = any(
+                not acc.signed
+                for acc in all_accounts
+                if acc.account_type == account_type
+            )
             if not_signed:
                 if not self._solace_implicit:
                     self._solace_implicit = create_solace(
@@ -266,6 +460,51 @@ class Shioaji:
         else:
             self._solace.trace_log(trade)
 
+    @property
+    def stock_account(self) -> typing.Optional[StockAccount]:
+        return getattr(self._solace, "default_stock_account", None)
+
+    @stock_account.setter
+    def stock_account(self, account: StockAccount):
+        self._solace.default_stock_account = account
+
+    @property
+    def futopt_account(self) -> typing.Optional[FutureAccount]:
+        return getattr(self._solace, "default_futopt_account", None)
+
+    @futopt_account.setter
+    def futopt_account(self, account: FutureAccount):
+        self._solace.default_futopt_account = account
+
+    def _today_iso(self) -> str:
+        ordinal = dt.date.today().toordinal()
+        if ordinal != self._today_ordinal:
+            self._today_ordinal = ordinal
+            self._today_str = dt.date.fromordinal(ordinal).isoformat()
+        return self._today_str
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="shioaji-io"
+            )
+        return self._io_pool
+
+    def _rebuild_default_account_map(self):
+        self._default_account_map = {
+            Stock: self.stock_account,
+            Future: self.futopt_account,
+            Option: self.futopt_account,
+        }
+
+    def _resolve_target_contract(self, target_code: str) -> typing.Optional[Contract]:
+        contract = self._target_code_index.get(target_code)
+        if contract is None:
+            contract = self.Contracts.Futures.get(target_code)
+            if contract is not None:
+                self._target_code_index[target_code] = contract
+        return contract
+
     def _portfolio_default_account(self):
         if self.stock_account:
             return self.stock_account
@@ -279,13 +518,31 @@ class Shioaji:
         contract_download: bool = False,
         contracts_timeout: int = 0,
         contracts_cb: typing.Callable[[], None] = None,
+        contracts_version: str = "",
+        contracts_chunk_cb: typing.Callable[[SecurityType, bytes], None] = None,
     ):
         self.Contracts = self._solace.Contracts = new_contracts()
+        self._target_code_index = {}
+        self._contracts_epoch += 1
         contract_file = get_contracts_filename()
-        clear_outdated_contract_cache(contract_file)
-        todayfile_exist = check_contract_cache(contract_file)
-        if contract_download or not todayfile_exist:
-            self._solace.fetch_all_contract(contracts_timeout, contracts_cb)
+        if contracts_version:
+            # the server version is authoritative: the cache is fresh until
+            # the server revs it, whatever the file mtime says
+            cache_fresh = contract_file.exists() and (
+                read_contract_version(contract_file) == contracts_version
+            )
+        else:
+            clear_outdated_contract_cache(contract_file)
+            cache_fresh = check_contract_cache(contract_file)
+        if contract_download or not cache_fresh:
+            fetch_stream = getattr(self._solace, "fetch_all_contract_stream", None)
+            if contracts_chunk_cb is not None and fetch_stream is not None:
+                # overlap per-SecurityType parsing with the remaining download
+                fetch_stream(contracts_timeout, contracts_cb, contracts_chunk_cb)
+            else:
+                self._solace.fetch_all_contract(contracts_timeout, contracts_cb)
+            if contracts_version:
+                write_contract_version(contract_file, contracts_version)
         else:
             if self.Contracts.status == FetchStatus.Unfetch:
                 self.Contracts.status = FetchStatus.Fetching
@@ -294,7 +551,7 @@ class Shioaji:
                     self._solace.fetch_all_contract(contracts_timeout, contracts_cb)
                 else:
                     if contracts_cb:
-                        for securitytype in SecurityType:
+                        for securitytype in _SECURITY_TYPES:
                             contracts_cb(securitytype)
             else:
                 pass
@@ -336,14 +593,15 @@ class Shioaji:
                 api_key, secret_key, subscribe_trade, receive_window
             )
         if accounts:
-            with configure_scope() as scope:
-                scope.user = dict(id=person_id, username=accounts[0].username)
+            from sentry_sdk import set_user
+
+            set_user(dict(id=person_id, username=accounts[0].username))
         error_tracking = self._solace.error_tracking(person_id)
         set_error_tracking(self.simulation, error_tracking)
         if fetch_contract:
             self.fetch_contracts(contract_download, contracts_timeout, contracts_cb)
-        self.stock_account = self._solace.default_stock_account
-        self.futopt_account = self._solace.default_futopt_account
+        self._rebuild_default_account_map()
+        self._accounts_cache = accounts
         return accounts
 
     def logout(self) -> bool:
@@ -353,10 +611,12 @@ class Shioaji:
 
     def subscribe_trade(self, account: Account) -> bool:
         res = self._solace.subscribe_trade(account, True)
+        self._accounts_cache = []
         return res
 
     def unsubscribe_trade(self, account: Account) -> bool:
         res = self._solace.subscribe_trade(account, False)
+        self._accounts_cache = []
         return res
 
     def activate_ca(self, ca_path: str, ca_passwd: str, person_id: str = "", store: int = 0):
@@ -368,6 +628,7 @@ class Shioaji:
             ca_passwd (str): password of your ca
         """
         res = self._solace.activate_ca(ca_path, ca_passwd, person_id, store)
+        self._accounts_cache = []
         return res
 
     def get_ca_expiretime(self, person_id: str) -> dt.datetime:
@@ -376,7 +637,9 @@ class Shioaji:
 
     def list_accounts(self) -> typing.List[Account]:
         """list all account you have"""
-        return self._solace.list_accounts()
+        accounts = self._solace.list_accounts()
+        self._accounts_cache = accounts
+        return accounts
 
     def set_default_account(self, account):
         """set default account for trade when place order not specific
@@ -386,11 +649,10 @@ class Shioaji:
                 choice the account from listing account and set as default
         """
         if isinstance(account, StockAccount):
-            self._solace.default_stock_account = account
             self.stock_account = account
         elif isinstance(account, FutureAccount):
-            self._solace.default_futopt_account = account
             self.futopt_account = account
+        self._rebuild_default_account_map()
 
     def place_order(
         self,
@@ -407,18 +669,17 @@ class Shioaji:
                 pass Shioaji.Order object to place order
         """
         if not order.account:
-            if isinstance(contract, Future) or isinstance(contract, Option):
-                order.account = self.futopt_account
-            elif isinstance(contract, Stock):
-                order.account = self.stock_account
-            else:
+            account = self._default_account_map.get(type(contract))
+            if account is None:
                 log.error("Please provide the account place to.")
                 return None
+            order.account = account
 
         if contract.target_code:
-            if self.Contracts.Futures.get(contract.target_code) is None:
+            target_contract = self._resolve_target_contract(contract.target_code)
+            if target_contract is None:
                 raise TargetContractNotExistError(contract)
-            contract = self.Contracts.Futures.get(contract.target_code)
+            contract = target_contract
 
         trade = self._solace.place_order(contract, order, timeout, cb)
 
@@ -478,15 +739,21 @@ class Shioaji:
         if not len(combo_contract.legs) == 2:
             log.error("Just allow order with two contracts.")
 
-        for leg in combo_contract.legs:
-            if leg.target_code:
-                target_contract = self.Contracts.Futures.get(leg.target_code)
-                if target_contract is None:
-                    raise TargetContractNotExistError(leg)
-                leg.code = target_contract.code
-                leg.name = target_contract.name
-                leg.symbol = target_contract.symbol
-                leg.target_code = target_contract.target_code
+        # resolve once per contracts epoch: on repeat submits of the same
+        # combo the fast path is a single attribute compare
+        if getattr(combo_contract, "_resolved_epoch", -1) != self._contracts_epoch:
+            for leg in combo_contract.legs:
+                if leg.target_code:
+                    target_contract = self._resolve_target_contract(leg.target_code)
+                    if target_contract is None:
+                        raise TargetContractNotExistError(leg)
+                    leg.code = target_contract.code
+                    leg.name = target_contract.name
+                    leg.symbol = target_contract.symbol
+                    leg.target_code = target_contract.target_code
+            object.__setattr__(
+                combo_contract, "_resolved_epoch", self._contracts_epoch
+            )
 
         if order.account:
             if order.account.account_type == AccountType.Future:
@@ -534,41 +801,44 @@ class Shioaji:
             if account.signed or self.simulation:
                 self._solace.update_status(account, timeout=timeout, cb=cb)
         else:
-            if self.stock_account:
-                if self.stock_account.signed or self.simulation:
-                    self._solace.update_status(
-                        self.stock_account, timeout=timeout, cb=cb
-                    )
-            if self.futopt_account:
-                if self.futopt_account.signed or self.simulation:
-                    self._solace.update_status(
-                        self.futopt_account, timeout=timeout, cb=cb
+            accounts = [
+                acc
+                for acc in (self.stock_account, self.futopt_account)
+                if acc and (acc.signed or self.simulation)
+            ]
+            if len(accounts) == 2:
+                pool = self._get_io_pool()
+                futures = [
+                    pool.submit(
+                        self._solace.update_status, acc, timeout=timeout, cb=cb
                     )
+                    for acc in accounts
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                for acc in accounts:
+                    self._solace.update_status(acc, timeout=timeout, cb=cb)
 
+    @require_signed
     def stock_reserve_summary(
         self,
         account: Account,
         timeout: int = 5000,
         cb: typing.Callable[[ReserveStocksSummaryResponse], None] = None,
     ) -> ReserveStocksSummaryResponse:
-        if account.signed:
-            resp = self._solace.stock_reserve_summary(account, timeout, cb)
-            return resp
-        else:
-            raise AccountNotSignError(account)
+        return self._solace.stock_reserve_summary(account, timeout, cb)
 
+    @require_signed
     def stock_reserve_detail(
         self,
         account: Account,
         timeout: int = 5000,
         cb: typing.Callable[[ReserveStocksDetailResponse], None] = None,
     ) -> ReserveStocksDetailResponse:
-        if account.signed:
-            resp = self._solace.stock_reserve_detail(account, timeout, cb)
-            return resp
-        else:
-            raise AccountNotSignError(account)
+        return self._solace.stock_reserve_detail(account, timeout, cb)
 
+    @require_signed
     def reserve_stock(
         self,
         account: Account,
@@ -577,24 +847,18 @@ class Shioaji:
         timeout: int = 5000,
         cb: typing.Callable[[ReserveStockResponse], None] = None,
     ) -> ReserveStockResponse:
-        if account.signed:
-            resp = self._solace.reserve_stock(account, contract, share, timeout, cb)
-            return resp
-        else:
-            raise AccountNotSignError(account)
+        return self._solace.reserve_stock(account, contract, share, timeout, cb)
 
+    @require_signed
     def earmarking_detail(
         self,
         account: Account,
         timeout: int = 5000,
         cb: typing.Callable[[EarmarkStocksDetailResponse], None] = None,
     ) -> EarmarkStocksDetailResponse:
-        if account.signed:
-            resp = self._solace.earmarking_detail(account, timeout, cb)
-            return resp
-        else:
-            raise AccountNotSignError(account)
+        return self._solace.earmarking_detail(account, timeout, cb)
 
+    @require_signed
     def reserve_earmarking(
         self,
         account: Account,
@@ -604,13 +868,9 @@ class Shioaji:
         timeout: int = 5000,
         cb: typing.Callable[[ReserveEarmarkingResponse], None] = None,
     ) -> ReserveEarmarkingResponse:
-        if account.signed:
-            resp = self._solace.reserve_earmarking(
-                account, contract, share, price, timeout, cb
-            )
-            return resp
-        else:
-            raise AccountNotSignError(account)
+        return self._solace.reserve_earmarking(
+            account, contract, share, price, timeout, cb
+        )
 
     def update_combostatus(
         self,
@@ -821,18 +1081,44 @@ class Shioaji:
             if self.futopt_account:
                 return self._solace.margin(self.futopt_account, timeout=timeout, cb=cb)
 
-    def list_trades(self) -> typing.List[Trade]:
-        """list all trades"""
-        return self._solace.trades
+    def list_trades(
+        self,
+        status: Status = None,
+        account: Account = None,
+    ) -> typing.List[Trade]:
+        """list all trades, optionally filtered
 
-    def list_combotrades(self) -> typing.List[ComboTrade]:
-        """list all combotrades"""
-        return self._solace.combotrades
+        Args:
+            status (:obj:Status): only trades in this order status
+            account (:obj:Account): only trades placed on this account
+        """
+        trades = self._solace.trades
+        if status is None and account is None:
+            return trades
+        return [trade for trade in trades if _trade_match(trade, status, account)]
+
+    def list_combotrades(
+        self,
+        status: Status = None,
+        account: Account = None,
+    ) -> typing.List[ComboTrade]:
+        """list all combotrades, optionally filtered
+
+        Args:
+            status (:obj:Status): only trades in this order status
+            account (:obj:Account): only trades placed on this account
+        """
+        combotrades = self._solace.combotrades
+        if status is None and account is None:
+            return combotrades
+        return [
+            trade for trade in combotrades if _trade_match(trade, status, account)
+        ]
 
     def ticks(
         self,
         contract: BaseContract,
-        date: str = dt.date.today().strftime("%Y-%m-%d"),
+        date: str = None,
         query_type: TicksQueryType = TicksQueryType.AllDay,
         time_start: typing.Union[str, dt.time] = None,
         time_end: typing.Union[str, dt.time] = None,
@@ -844,8 +1130,10 @@ class Shioaji:
 
         Arg:
             contract (:obj:Shioaji.BaseContract)
-            date (str): "2020-02-02"
+            date (str): "2020-02-02" (Default: today)
         """
+        if date is None:
+            date = self._today_iso()
         ticks = self._solace.ticks(
             contract,
             date,
@@ -858,11 +1146,50 @@ class Shioaji:
         )
         return ticks
 
+    def ticks_batch(
+        self,
+        contracts: typing.List[BaseContract],
+        date: str = None,
+        query_type: TicksQueryType = TicksQueryType.AllDay,
+        time_start: typing.Union[str, dt.time] = None,
+        time_end: typing.Union[str, dt.time] = None,
+        last_cnt: int = 0,
+        timeout: int = 30000,
+        max_workers: int = 8,
+    ) -> typing.List[Ticks]:
+        """get tick volumn of multiple contracts with overlapped round-trips
+
+        Arg:
+            contracts (:obj:List of Shioaji.BaseContract)
+            date (str): "2020-02-02"
+        """
+        if not contracts:
+            return []
+        if date is None:
+            date = self._today_iso()
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(contracts))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda contract: self.ticks(
+                        contract,
+                        date,
+                        query_type,
+                        time_start,
+                        time_end,
+                        last_cnt,
+                        timeout,
+                    ),
+                    contracts,
+                )
+            )
+
     def kbars(
         self,
         contract: BaseContract,
-        start: str = (dt.date.today() - dt.timedelta(days=1)).strftime("%Y-%m-%d"),
-        end: str = dt.date.today().strftime("%Y-%m-%d"),
+        start: str = None,
+        end: str = None,
         timeout: int = 30000,
         cb: typing.Callable[[Kbars], None] = None,
     ) -> Kbars:
@@ -870,15 +1197,50 @@ class Shioaji:
 
         Arg:
             contract (:obj:Shioaji.BaseContract)
-            start (str): "2020-02-02"
-            end (str): "2020-06-02"
+            start (str): "2020-02-02" (Default: yesterday)
+            end (str): "2020-06-02" (Default: today)
         """
+        if start is None:
+            start = dt.date.fromordinal(dt.date.today().toordinal() - 1).isoformat()
+        if end is None:
+            end = self._today_iso()
         kbars = self._solace.kbars(contract, start, end, timeout, cb)
         return kbars
 
+    def kbars_batch(
+        self,
+        contracts: typing.List[BaseContract],
+        start: str = None,
+        end: str = None,
+        timeout: int = 30000,
+        max_workers: int = 8,
+    ) -> typing.List[Kbars]:
+        """get Kbar of multiple contracts with overlapped round-trips
+
+        Arg:
+            contracts (:obj:List of Shioaji.BaseContract)
+            start (str): "2020-02-02"
+            end (str): "2020-06-02"
+        """
+        if not contracts:
+            return []
+        if start is None:
+            start = dt.date.fromordinal(dt.date.today().toordinal() - 1).isoformat()
+        if end is None:
+            end = self._today_iso()
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(contracts))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda contract: self.kbars(contract, start, end, timeout),
+                    contracts,
+                )
+            )
+
     def daily_quotes(
         self,
-        date: dt.date = dt.date.today(),
+        date: dt.date = None,
         exclude: bool = True,
         timeout: int = 5000,
         cb: typing.Callable[[DailyQuotes], None] = None,
@@ -891,21 +1253,137 @@ class Shioaji:
             exclude (:bool):
                 exclude warrant data (Default: True)
         """
+        if date is None:
+            date = dt.date.today()
         daily_quotes = self._solace.daily_quotes(date, exclude, timeout, cb)
         return daily_quotes
 
+    def _record_live_tick(self, *args) -> None:
+        # callback signature is (exchange, tick) or (context, exchange,
+        # tick) when bound, so index from the back
+        tick = args[-1]
+        if not getattr(tick, "simtrade", False):
+            # intern the code: every push for a symbol then keys the cache
+            # with the same str object, so dict probes are pointer compares
+            self._live_ticks[intern(tick.code)] = (args[-2], tick, time.monotonic())
+
+    def _record_live_bidask(self, *args) -> None:
+        bidask = args[-1]
+        if not getattr(bidask, "simtrade", False):
+            self._live_bidasks[intern(bidask.code)] = (bidask, time.monotonic())
+
+    def _live_snapshot(self, code: str) -> typing.Optional[Snapshot]:
+        """build a Snapshot from the latest stream pushes for the code
+
+        Every push overwrites the cached tick, so the view is at least as
+        fresh as a round trip to the server. Returns None when the code
+        has not streamed a tick within _LIVE_SNAPSHOT_TTL, which sends
+        the caller down the RPC path.
+        """
+        cached = self._live_ticks.get(code)
+        if cached is None:
+            return None
+        now = time.monotonic()
+        exchange, tick, received = cached
+        if now - received > _LIVE_SNAPSHOT_TTL:
+            self._live_ticks.pop(code, None)
+            self._live_bidasks.pop(code, None)
+            return None
+        from shioaji.data import Snapshot
+
+        buy_price = buy_volume = sell_price = 0.0
+        sell_volume = 0
+        cached_bidask = self._live_bidasks.get(code)
+        bidask = None
+        if cached_bidask is not None:
+            bidask, bidask_received = cached_bidask
+            if now - bidask_received > _LIVE_SNAPSHOT_TTL:
+                bidask = None
+        if bidask is not None:
+            if bidask.bid_price:
+                buy_price = float(bidask.bid_price[0])
+                buy_volume = float(bidask.bid_volume[0])
+            if bidask.ask_price:
+                sell_price = float(bidask.ask_price[0])
+                sell_volume = int(bidask.ask_volume[0])
+        return Snapshot.from_trusted(
+            ts=int(tick.datetime.timestamp() * 1e9),
+            code=code,
+            exchange=getattr(exchange, "value", exchange),
+            open=float(tick.open),
+            high=float(tick.high),
+            low=float(tick.low),
+            close=float(tick.close),
+            tick_type=_TICK_TYPES[tick.tick_type],
+            change_price=float(tick.price_chg),
+            change_rate=float(tick.pct_chg),
+            change_type=_CHANGE_TYPES[tick.chg_type],
+            average_price=float(tick.avg_price),
+            volume=int(tick.volume),
+            total_volume=int(tick.total_volume),
+            amount=int(tick.amount),
+            total_amount=int(tick.total_amount),
+            yesterday_volume=0.0,
+            buy_price=buy_price,
+            buy_volume=buy_volume,
+            sell_price=sell_price,
+            sell_volume=sell_volume,
+            volume_ratio=0.0,
+        )
+
     def snapshots(
         self,
         contracts: typing.List[typing.Union[Option, Future, Stock, Index]],
         timeout: int = 30000,
         cb: typing.Callable[[Snapshot], None] = None,
+        as_array: bool = False,
+        use_push_cache: bool = True,
     ) -> typing.List[Snapshot]:
         """get contract snapshot info
 
+        Contracts whose codes streamed a tick within the last minute are
+        served from the push cache without a round trip; only the rest go
+        to the server. A caller-supplied cb observes cache-served
+        snapshots as well as the server responses.
+
         Arg:
             contract (:obj:List of contract)
+            as_array (:bool):
+                pack the result into a NumPy structured array (one row per
+                contract) instead of a list of Snapshot objects, so
+                column-wise analytics iterate contiguous memory
+            use_push_cache (:bool):
+                pass False to force a server round trip for every
+                contract, e.g. when yesterday_volume/volume_ratio are
+                needed (tick frames do not carry them)
         """
-        snapshots = self._solace.snapshots(contracts, timeout, cb)
+        if use_push_cache and self._live_ticks:
+            merged = {}
+            remote = []
+            for contract in contracts:
+                snapshot = self._live_snapshot(contract.code)
+                if snapshot is None:
+                    remote.append(contract)
+                else:
+                    merged[contract.code] = snapshot
+                    if cb is not None:
+                        cb(snapshot)
+            if remote:
+                for snapshot in self._solace.snapshots(remote, timeout, cb):
+                    merged[snapshot.code] = snapshot
+            # codes the server omitted are dropped, matching the baseline
+            # behavior of returning exactly what the server sent back
+            snapshots = [
+                merged[contract.code]
+                for contract in contracts
+                if contract.code in merged
+            ]
+        else:
+            snapshots = self._solace.snapshots(contracts, timeout, cb)
+        if as_array:
+            from shioaji.data import snapshots_to_array
+
+            return snapshots_to_array(snapshots)
         return snapshots
 
     def scanners(
@@ -983,60 +1461,77 @@ class Shioaji:
     def set_context(self, context: typing.Any):
         self.quote.set_context(context)
 
-    def on_tick_stk_v1(
-        self, bind: bool = False
-    ) -> typing.Callable[[Exchange, TickSTKv1], None]:
-        def wrap_deco(
-            func: typing.Callable[[Exchange, TickSTKv1], None]
-        ) -> typing.Callable[[Exchange, TickSTKv1], None]:
-            self.quote.set_on_tick_stk_v1_callback(func, bind)
+    def _stream_deco(self, setter_name: str, record, bind, batch, coalesce_us):
+        """shared body for the five v1 stream-callback decorators"""
+        setter = getattr(self.quote, setter_name)
+
+        def wrap_deco(func):
+            if batch > 1:
+                callback = _batch_stream_callback(record, func, batch, coalesce_us)
+            elif record is not None:
+
+                @functools.wraps(func)
+                def callback(*args):
+                    record(*args)
+                    func(*args)
+
+            else:
+                callback = func
+            setter(callback, bind)
             return func
 
         return wrap_deco
 
+    def on_tick_stk_v1(
+        self, bind: bool = False, batch: int = 1, coalesce_us: int = 0
+    ) -> typing.Callable[[Exchange, TickSTKv1], None]:
+        return self._stream_deco(
+            "set_on_tick_stk_v1_callback",
+            self._record_live_tick,
+            bind,
+            batch,
+            coalesce_us,
+        )
+
     def on_tick_fop_v1(
-        self, bind: bool = False
+        self, bind: bool = False, batch: int = 1, coalesce_us: int = 0
     ) -> typing.Callable[[Exchange, TickFOPv1], None]:
-        def wrap_deco(
-            func: typing.Callable[[Exchange, TickFOPv1], None]
-        ) -> typing.Callable[[Exchange, TickFOPv1], None]:
-            self.quote.set_on_tick_fop_v1_callback(func, bind)
-            return func
-
-        return wrap_deco
+        return self._stream_deco(
+            "set_on_tick_fop_v1_callback",
+            self._record_live_tick,
+            bind,
+            batch,
+            coalesce_us,
+        )
 
     def on_bidask_stk_v1(
-        self, bind: bool = False
+        self, bind: bool = False, batch: int = 1, coalesce_us: int = 0
     ) -> typing.Callable[[Exchange, BidAskSTKv1], None]:
-        def wrap_deco(
-            func: typing.Callable[[Exchange, BidAskSTKv1], None]
-        ) -> typing.Callable[[Exchange, BidAskSTKv1], None]:
-            self.quote.set_on_bidask_stk_v1_callback(func, bind)
-            return func
-
-        return wrap_deco
+        return self._stream_deco(
+            "set_on_bidask_stk_v1_callback",
+            self._record_live_bidask,
+            bind,
+            batch,
+            coalesce_us,
+        )
 
     def on_bidask_fop_v1(
-        self, bind: bool = False
+        self, bind: bool = False, batch: int = 1, coalesce_us: int = 0
     ) -> typing.Callable[[Exchange, BidAskFOPv1], None]:
-        def wrap_deco(
-            func: typing.Callable[[Exchange, BidAskFOPv1], None]
-        ) -> typing.Callable[[Exchange, BidAskFOPv1], None]:
-            self.quote.set_on_bidask_fop_v1_callback(func, bind)
-            return func
-
-        return wrap_deco
+        return self._stream_deco(
+            "set_on_bidask_fop_v1_callback",
+            self._record_live_bidask,
+            bind,
+            batch,
+            coalesce_us,
+        )
 
     def on_quote_stk_v1(
-        self, bind: bool = False
+        self, bind: bool = False, batch: int = 1, coalesce_us: int = 0
     ) -> typing.Callable[[Exchange, QuoteSTKv1], None]:
-        def wrap_deco(
-            func: typing.Callable[[Exchange, QuoteSTKv1], None]
-        ) -> typing.Callable[[Exchange, QuoteSTKv1], None]:
-            self.quote.set_on_quote_stk_v1_callback(func, bind)
-            return func
-
-        return wrap_deco
+        return self._stream_deco(
+            "set_on_quote_stk_v1_callback", None, bind, batch, coalesce_us
+        )
 
     def on_quote(
         self, func: typing.Callable[[str, dict], None]
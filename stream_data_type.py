@@ -1,20 +1,63 @@
 import datetime as dt
+from array import array
 from decimal import Decimal
-from typing import List
 
 
-class TickSTKv1:
+class _DecimalCompat:
+    """lazy Decimal views over native float fields
+
+    Price fields are stored as float64 so decoding a tick no longer
+    allocates a Decimal per field; ``tick.close_decimal`` rebuilds the
+    Decimal on demand for callers that still want exact arithmetic.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        if name.endswith("_decimal"):
+            value = getattr(self, name[: -len("_decimal")])
+            if isinstance(value, (list, array)):
+                return [Decimal(str(item)) for item in value]
+            return Decimal(str(value))
+        raise AttributeError(name)
+
+
+_L5_PRICE_ZEROS = (0.0,) * 5
+_L5_VOL_ZEROS = (0,) * 5
+
+
+class _L5Book(_DecimalCompat):
+    """preallocated five-level book lanes
+
+    Each instance owns six fixed-size array.array buffers which decoders
+    fill in place with slice assignment (``msg.bid_price[:] = values``),
+    instead of allocating six lists plus thirty boxed numbers per
+    message.
+    """
+
+    __slots__ = ()
+
+    def __init__(self):
+        self.bid_price = array("d", _L5_PRICE_ZEROS)
+        self.bid_volume = array("q", _L5_VOL_ZEROS)
+        self.diff_bid_vol = array("q", _L5_VOL_ZEROS)
+        self.ask_price = array("d", _L5_PRICE_ZEROS)
+        self.ask_volume = array("q", _L5_VOL_ZEROS)
+        self.diff_ask_vol = array("q", _L5_VOL_ZEROS)
+
+
+class TickSTKv1(_DecimalCompat):
     """Tick Stock v1
     Attributes:
         code (str): code
         datetime (datetime.datetime): datetime
-        open (Decimal): open
-        avg_price (Decimal): average price
-        close (Decimal): deal price
-        high (Decimal): high since market open
-        low (Decimal): low since market open
-        amount (Decimal): amount (NTD)
-        total_amount (Decimal): total amount (NTD)
+        open (float): open
+        avg_price (float): average price
+        close (float): deal price
+        high (float): high since market open
+        low (float): low since market open
+        amount (float): amount (NTD)
+        total_amount (float): total amount (NTD)
         volume (int): volume (K shares)
             if intraday_odd: (share)
         total_volume (int): total volume (K shares)
@@ -23,8 +66,8 @@ class TickSTKv1:
             {1: buy deal, 2: sell deal, 0: can't judge}
         chg_type (int): (漲跌註記)
             {1: limit up, 2: up, 3: unchanged, 4: down, 5: limit down}
-        price_chg (Decimal): price change
-        pct_chg (Decimal): percentage change (%)
+        price_chg (float): price change
+        pct_chg (float): percentage change (%)
         bid_side_total_vol(int): total bid deal volume (K shares, 買盤成交總量)
             if intraday_odd: (share)
         ask_side_total_vol (int): total ask deal volume (K shares, 賣盤成交總量)
@@ -41,19 +84,19 @@ class TickSTKv1:
 
     code: str
     datetime: dt.datetime
-    open: Decimal
-    avg_price: Decimal
-    close: Decimal
-    high: Decimal
-    low: Decimal
-    amount: Decimal
-    total_amount: Decimal
+    open: float
+    avg_price: float
+    close: float
+    high: float
+    low: float
+    amount: float
+    total_amount: float
     volume: int
     total_volume: int
     tick_type: int
     chg_type: int
-    price_chg: Decimal
-    pct_chg: Decimal
+    price_chg: float
+    pct_chg: float
     bid_side_total_vol: int
     ask_side_total_vol: int
     bid_side_total_cnt: int
@@ -64,100 +107,163 @@ class TickSTKv1:
     simtrade: bool
     intraday_odd: bool
 
+    __slots__ = (
+        "code",
+        "datetime",
+        "open",
+        "avg_price",
+        "close",
+        "high",
+        "low",
+        "amount",
+        "total_amount",
+        "volume",
+        "total_volume",
+        "tick_type",
+        "chg_type",
+        "price_chg",
+        "pct_chg",
+        "bid_side_total_vol",
+        "ask_side_total_vol",
+        "bid_side_total_cnt",
+        "ask_side_total_cnt",
+        "closing_oddlot_shares",
+        "fixed_trade_vol",
+        "suspend",
+        "simtrade",
+        "intraday_odd",
+    )
 
-class TickFOPv1:
+
+class TickFOPv1(_DecimalCompat):
     """Tick Futures Options v1
     Attributes:
         code (str): code
         datetime (datetime.datetime): datetime
-        open (Decimal): open
-        underlying_price (Decimal): underlying price (標的物價格)
+        open (float): open
+        underlying_price (float): underlying price (標的物價格)
         bid_side_total_vol(int): total buy deal volume (lot, 買盤成交總量)
         ask_side_total_vol(int): total sell deal volume (lot, 賣盤成交總量)
-        avg_price (Decimal): average price
-        close (Decimal): deal price
-        high (Decimal): high since market open
-        low (Decimal): low since market open
-        amount (Decimal): amount (= deal price)
-        total_amount (Decimal): total amount (= sum of deal price)
+        avg_price (float): average price
+        close (float): deal price
+        high (float): high since market open
+        low (float): low since market open
+        amount (float): amount (= deal price)
+        total_amount (float): total amount (= sum of deal price)
         volume (int): volume (lot)
         total_volume (int): total volume (lot)
         tick_type (int): tick type (內外盤別)
             {1: buy deal, 2: sell deal, 0: can't judge}
         chg_type (int): (漲跌註記)
             {1: limit up, 2: up, 3: unchanged, 4: down, 5: limit down}
-        price_chg (Decimal): price change
-        pct_chg (Decimal): percentage change (%)
+        price_chg (float): price change
+        pct_chg (float): percentage change (%)
         simtrade (int): simulated trade (試撮)
     """
 
     code: str
     datetime: dt.datetime
-    open: Decimal
-    underlying_price: Decimal
+    open: float
+    underlying_price: float
     bid_side_total_vol: int
     ask_side_total_vol: int
-    avg_price: Decimal
-    close: Decimal
-    high: Decimal
-    low: Decimal
-    amount: Decimal
-    total_amount: Decimal
+    avg_price: float
+    close: float
+    high: float
+    low: float
+    amount: float
+    total_amount: float
     volume: int
     total_volume: int
     tick_type: int
     chg_type: int
-    price_chg: Decimal
-    pct_chg: Decimal
+    price_chg: float
+    pct_chg: float
     simtrade: bool
 
+    __slots__ = (
+        "code",
+        "datetime",
+        "open",
+        "underlying_price",
+        "bid_side_total_vol",
+        "ask_side_total_vol",
+        "avg_price",
+        "close",
+        "high",
+        "low",
+        "amount",
+        "total_amount",
+        "volume",
+        "total_volume",
+        "tick_type",
+        "chg_type",
+        "price_chg",
+        "pct_chg",
+        "simtrade",
+    )
+
 
-class BidAskSTKv1:
+class BidAskSTKv1(_L5Book):
     """BidAsk Stock v1
     Attributes:
         code (str): code
         datetime (datetime.datetime): datetime
-        bid_price (list of Decimal): bid price
-        bid_volume (list of int): bid volume (lot), (張)
-        diff_bid_vol (list of int): (lot), (張, 買價增減量)
-        ask_price (list of Decimal): ask price
-        ask_volume (list of int): ask volume (lot), (張)
-        diff_ask_vol (list of int): (lot), (張, 賣價增減量)
+        bid_price (array of float): bid price
+        bid_volume (array of int): bid volume (lot), (張)
+        diff_bid_vol (array of int): (lot), (張, 買價增減量)
+        ask_price (array of float): ask price
+        ask_volume (array of int): ask volume (lot), (張)
+        diff_ask_vol (array of int): (lot), (張, 賣價增減量)
         suspend (bool): suspend (暫停交易)
         simtrade (bool): simulated trade (試撮)
     """
 
     code: str
     datetime: dt.datetime
-    bid_price: List[Decimal]
-    bid_volume: List[int]
-    diff_bid_vol: List[int]
-    ask_price: List[Decimal]
-    ask_volume: List[int]
-    diff_ask_vol: List[int]
+    bid_price: array
+    bid_volume: array
+    diff_bid_vol: array
+    ask_price: array
+    ask_volume: array
+    diff_ask_vol: array
     suspend: bool
     simtrade: bool
     intraday_odd: bool
 
+    __slots__ = (
+        "code",
+        "datetime",
+        "bid_price",
+        "bid_volume",
+        "diff_bid_vol",
+        "ask_price",
+        "ask_volume",
+        "diff_ask_vol",
+        "suspend",
+        "simtrade",
+        "intraday_odd",
+    )
 
-class BidAskFOPv1:
+
+class BidAskFOPv1(_L5Book):
     """BidAsk Futures Options v1
     Attributes:
         code (str): code
         datetime (datetime.datetime): datetime
         bid_total_vol (int): total buy deal volume (買盤成交總量)
         ask_total_vol (int): total sell deal volume (賣盤成交總量)
-        bid_price (list of Decimal): bid price
-        bid_volume (list of int): bid volume
-        diff_bid_vol (list of int): (買價增減量)
-        ask_price (list of Decimal): ask price
-        ask_volume (list of int): ask volume
-        diff_ask_vol (list of int): (賣價增減量)
-        first_derived_bid_price (Decimal): first derived bid price (衍生一檔買價)
-        first_derived_ask_price (Decimal): first derived ask price (衍生一檔賣價)
+        bid_price (array of float): bid price
+        bid_volume (array of int): bid volume
+        diff_bid_vol (array of int): (買價增減量)
+        ask_price (array of float): ask price
+        ask_volume (array of int): ask volume
+        diff_ask_vol (array of int): (賣價增減量)
+        first_derived_bid_price (float): first derived bid price (衍生一檔買價)
+        first_derived_ask_price (float): first derived ask price (衍生一檔賣價)
         first_derived_bid_vol (int): first derived bid volume (衍生一檔買量)
         first_derived_ask_vol (int): first derived bid volume (衍生一檔賣量)
-        underlying_price (Decimal): underlying price (標的物價格)
+        underlying_price (float): underlying price (標的物價格)
         simtrade (int): simulated trade (試撮)
     """
 
@@ -165,57 +271,76 @@ class BidAskFOPv1:
     datetime: dt.datetime
     bid_total_vol: int
     ask_total_vol: int
-    bid_price: List[Decimal]
-    bid_volume: List[int]
-    diff_bid_vol: List[int]
-    ask_price: List[Decimal]
-    ask_volume: List[int]
-    diff_ask_vol: List[int]
-    first_derived_bid_price: Decimal
-    first_derived_ask_price: Decimal
+    bid_price: array
+    bid_volume: array
+    diff_bid_vol: array
+    ask_price: array
+    ask_volume: array
+    diff_ask_vol: array
+    first_derived_bid_price: float
+    first_derived_ask_price: float
     first_derived_bid_vol: int
     first_derived_ask_vol: int
-    underlying_price: Decimal
+    underlying_price: float
     simtrade: bool
 
+    __slots__ = (
+        "code",
+        "datetime",
+        "bid_total_vol",
+        "ask_total_vol",
+        "bid_price",
+        "bid_volume",
+        "diff_bid_vol",
+        "ask_price",
+        "ask_volume",
+        "diff_ask_vol",
+        "first_derived_bid_price",
+        "first_derived_ask_price",
+        "first_derived_bid_vol",
+        "first_derived_ask_vol",
+        "underlying_price",
+        "simtrade",
+    )
+
 
-class QuoteSTKv1:
+class QuoteSTKv1(_L5Book):
     """Quote Stock v1
     Attributes:
         code (str): code
         datetime (datetime.datetime): datetime
-        open (Decimal): open
-        avg_price (Decimal): average price
-        close (Decimal): deal price
-        high (Decimal): high since market open
-        low (Decimal): low since market open
-        amount (Decimal): amount (NTD)
-        total_amount (Decimal): total amount (NTD)
+        open (float): open
+        avg_price (float): average price
+        close (float): deal price
+        high (float): high since market open
+        low (float): low since market open
+        amount (float): amount (NTD)
+        total_amount (float): total amount (NTD)
         volume (int): volume (K shares)
         total_volume (int): total volume (K shares)
         tick_type (int): tick type (內外盤別)
             {1: buy deal, 2: sell deal, 0: can't judge}
         chg_type (int): (漲跌註記)
             {1: limit up, 2: up, 3: unchanged, 4: down, 5: limit down}
-        price_chg (Decimal): price change
-        pct_chg (Decimal): percentage change (%)
+        price_chg (float): price change
+        pct_chg (float): percentage change (%)
         bid_side_total_vol(int): total bid deal volume (K shares, 買盤成交總量)
         ask_side_total_vol (int): total ask deal volume (K shares, 賣盤成交總量)
         bid_side_total_cnt (int): total number of buy deal (買盤成交筆數)
         ask_side_total_cnt (int): total number of sell deal (賣盤成交筆數)
         closing_oddlot_shares (int): (share, 盤後零股成交股數)
-        closing_oddlot_close (Decimal): closing oddlot close
-        closing_oddlot_amount (Decimal): closing oddlot amount
-        closing_oddlot_bid_price (Decimal): closing oddlot bid price
-        closing_oddlot_ask_price (Decimal): closing oddlot ask price
+        closing_oddlot_close (float): closing oddlot close
+        closing_oddlot_amount (float): closing oddlot amount
+        closing_oddlot_bid_price (float): closing oddlot bid price
+        closing_oddlot_ask_price (float): closing oddlot ask price
         fixed_trade_vol (int): fixed trade volume (K shares, 定盤成交量)
-        fixed_trade_amount (Decimal): fixed trade amount
-        bid_price (list of Decimal): bid price
-        bid_volume (list of int): bid volume (lot), (張)
-        diff_bid_vol (list of int): (lot), (張, 買價增減量)
-        ask_price (list of Decimal): ask price
-        ask_volume (list of int): ask volume (lot), (張)
-        diff_ask_vol (list of int): (lot), (張, 賣價增減量)
+        fixed_trade_amount (float): fixed trade amount
+        bid_price (array of float): bid price
+        bid_volume (array of int): bid volume (lot), (張)
+        diff_bid_vol (array of int): (lot), (張, 買價增減量)
+        ask_price (array of float): ask price
+        ask_volume (array of int): ask volume (lot), (張)
+        diff_ask_vol (array of int): (lot), (張, 賣價增減量)
         avail_borrowing (int): avail borrowing
         suspend (bool): suspend (暫停交易)
         simtrade (bool): simulated trade (試撮)
@@ -223,36 +348,105 @@ class QuoteSTKv1:
 
     code: str
     datetime: dt.datetime
-    open: Decimal
-    avg_price: Decimal
-    close: Decimal
-    high: Decimal
-    low: Decimal
-    amount: Decimal
-    total_amount: Decimal
+    open: float
+    avg_price: float
+    close: float
+    high: float
+    low: float
+    amount: float
+    total_amount: float
     volume: int
     total_volume: int
     tick_type: int
     chg_type: int
-    price_chg: Decimal
-    pct_chg: Decimal
+    price_chg: float
+    pct_chg: float
     bid_side_total_vol: int
     ask_side_total_vol: int
     bid_side_total_cnt: int
     ask_side_total_cnt: int
     closing_oddlot_shares: int
-    closing_oddlot_close: Decimal
-    closing_oddlot_amount: Decimal
-    closing_oddlot_bid_price: Decimal
-    closing_oddlot_ask_price: Decimal
+    closing_oddlot_close: float
+    closing_oddlot_amount: float
+    closing_oddlot_bid_price: float
+    closing_oddlot_ask_price: float
     fixed_trade_vol: int
-    fixed_trade_amount: Decimal
-    bid_price: List[Decimal]
-    bid_volume: List[int]
-    diff_bid_vol: List[int]
-    ask_price: List[Decimal]
-    ask_volume: List[int]
-    diff_ask_vol: List[int]
+    fixed_trade_amount: float
+    bid_price: array
+    bid_volume: array
+    diff_bid_vol: array
+    ask_price: array
+    ask_volume: array
+    diff_ask_vol: array
     avail_borrowing: int
     suspend: bool
     simtrade: bool
+
+    __slots__ = (
+        "code",
+        "datetime",
+        "open",
+        "avg_price",
+        "close",
+        "high",
+        "low",
+        "amount",
+        "total_amount",
+        "volume",
+        "total_volume",
+        "tick_type",
+        "chg_type",
+        "price_chg",
+        "pct_chg",
+        "bid_side_total_vol",
+        "ask_side_total_vol",
+        "bid_side_total_cnt",
+        "ask_side_total_cnt",
+        "closing_oddlot_shares",
+        "closing_oddlot_close",
+        "closing_oddlot_amount",
+        "closing_oddlot_bid_price",
+        "closing_oddlot_ask_price",
+        "fixed_trade_vol",
+        "fixed_trade_amount",
+        "bid_price",
+        "bid_volume",
+        "diff_bid_vol",
+        "ask_price",
+        "ask_volume",
+        "diff_ask_vol",
+        "avail_borrowing",
+        "suspend",
+        "simtrade",
+    )
+
+
+# structured mirror of TickSTKv1 for the ultra-hot path: batches of ticks
+# can be packed one row each and analyzed column-wise without touching a
+# Python object per message. datetime is epoch nanoseconds.
+TICK_STK_DTYPE = [
+    ("code", "S12"),
+    ("datetime", "i8"),
+    ("open", "f8"),
+    ("avg_price", "f8"),
+    ("close", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("amount", "f8"),
+    ("total_amount", "f8"),
+    ("volume", "i8"),
+    ("total_volume", "i8"),
+    ("tick_type", "i1"),
+    ("chg_type", "i1"),
+    ("price_chg", "f8"),
+    ("pct_chg", "f8"),
+    ("bid_side_total_vol", "i8"),
+    ("ask_side_total_vol", "i8"),
+    ("bid_side_total_cnt", "i4"),
+    ("ask_side_total_cnt", "i4"),
+    ("closing_oddlot_shares", "i8"),
+    ("fixed_trade_vol", "i8"),
+    ("suspend", "?"),
+    ("simtrade", "?"),
+    ("intraday_odd", "?"),
+]
@@ -1,53 +1,101 @@
 import os
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
 import datetime as dt
 from pathlib import Path
-import sentry_sdk
-from sentry_sdk.integrations.logging import SentryHandler
+from typing import Final
 
 from pysolace import SolClient
 from shioaji.error import TokenError, SystemMaintenance
 from shioaji._version import __version__
 
-LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
-SENTRY_URI = os.environ.get(
+# env-derived knobs parsed once into typed constants so downstream
+# branches compare ints and bools instead of re-coercing strings
+LOG_LEVEL: Final[str] = os.environ.get("LOG_LEVEL", "INFO").upper()
+SENTRY_URI: Final[str] = os.environ.get(
     "SENTRY_URI", "https://6aec6ef8db7148aa979a17453c0e44dd@sentry.io/1371618"
 )
-LOG_SENTRY = os.environ.get("LOG_SENTRY", "True")
-SENTRY_LOG_LEVEL = os.environ.get("SENTRY_LOG_LEVEL", "ERROR").upper()
-SJ_LOG_PATH = os.environ.get("SJ_LOG_PATH", "shioaji.log")
-LEGACY_TEST = int(os.environ.get("LEGACY_TEST", 0))
+LOG_SENTRY: Final[bool] = os.environ.get("LOG_SENTRY", "True").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+SENTRY_LOG_LEVEL: Final[int] = getattr(
+    logging, os.environ.get("SENTRY_LOG_LEVEL", "ERROR").upper(), logging.ERROR
+)
+SJ_LOG_PATH: Final[str] = os.environ.get("SJ_LOG_PATH", "shioaji.log")
+LEGACY_TEST: Final[int] = int(os.environ.get("LEGACY_TEST", 0))
 
 allow_log_level = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 assert LOG_LEVEL in allow_log_level, "LOG_LEVEL not allow, choice {}".format(
     (", ").join(allow_log_level)
 )
-LOGGING_LEVEL = getattr(logging, LOG_LEVEL)
+LOGGING_LEVEL: Final[int] = getattr(logging, LOG_LEVEL)
 
 log = logging.getLogger("shioaji")
 log.setLevel(LOGGING_LEVEL)
 
-console_handler = logging.FileHandler(SJ_LOG_PATH)
+console_handler = logging.FileHandler(SJ_LOG_PATH, delay=True)
 console_handler.setLevel(LOGGING_LEVEL)
 log_formatter = logging.Formatter(
-    "[%(levelname)1.1s %(asctime)s %(pathname)s:%(lineno)d:%(funcName)s] %(message)s"
+    "[%(levelname)1.1s %(asctime)s] %(message)s"
 )
 console_handler.setFormatter(log_formatter)
-log.addHandler(console_handler)
+# hand records off to a listener thread so formatting and the write()
+# syscall stay off the tick callback threads
+_log_queue = queue.Queue(-1)
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, console_handler, respect_handler_level=True
+)
+_log_listener.start()
+# drain whatever is still queued before the interpreter exits; the
+# listener thread is a daemon, so without this the last records (often
+# the error that ended the session) would be dropped
+atexit.register(_log_listener.stop)
+
+
+class LazySentryHandler(logging.Handler):
+    """defer sentry_sdk.init to the first record that actually emits
+
+    Importing and initializing sentry starts a transport thread, installs
+    atexit hooks and wraps sys.excepthook; none of that is worth paying
+    for sessions that never log at SENTRY_LOG_LEVEL.
+    """
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self._handler = None
+
+    def emit(self, record):
+        if self._handler is None:
+            import sentry_sdk
+            from sentry_sdk.integrations.logging import SentryHandler
+
+            sentry_sdk.init(SENTRY_URI)
+            handler = SentryHandler()
+            handler.setLevel(self.level)
+            handler.setFormatter(self.formatter)
+            self._handler = handler
+        self._handler.emit(record)
 
 
 def set_error_tracking(simulation: bool, error_tracking: bool):
     if LOG_SENTRY and not simulation and error_tracking:
-        sentry_sdk.init(SENTRY_URI)
-        sentry_handeler = SentryHandler()
+        sentry_handeler = LazySentryHandler()
         sentry_handeler.setLevel(SENTRY_LOG_LEVEL)
         sentry_handeler.setFormatter(log_formatter)
         log.addHandler(sentry_handeler)
 
 
 def raise_resp_error(status_code: int, resp: dict, session: SolClient):
-    log.error(resp)
     detail = resp.get("response", {}).get("detail", "")
+    # lazy %-formatting: the record body is only rendered when a handler
+    # emits, and the full resp rides along as structured extra data
+    log.error("resp status=%s detail=%s", status_code, detail, extra={"resp": resp})
     if status_code == 401:
         session.disconnect()
         raise TokenError(status_code, detail)
@@ -59,36 +107,53 @@ def raise_resp_error(status_code: int, resp: dict, session: SolClient):
 
 def clear_outdated_contract_cache(contract_path: Path, keep_days: int = 3):
     contract_dir = contract_path.parent
-    utcnow = dt.datetime.utcnow()
+    # age > keep_days whole days, same cut as the old timedelta.days check
+    cutoff_ts = time.time() - (keep_days + 1) * 86400.0
     try:
-        for file_path in contract_dir.iterdir():
-            if file_path.suffix not in [".pkl", ".lock"]:
-                continue
-            if not file_path.name.startswith("contract"):
-                continue
-            file_datetime = dt.datetime.utcfromtimestamp(file_path.stat().st_mtime)
-            if (utcnow - file_datetime).days > keep_days:
-                file_path.unlink()
+        with os.scandir(contract_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith("contract"):
+                    continue
+                if not name.endswith((".pkl", ".lock")):
+                    continue
+                if entry.stat().st_mtime <= cutoff_ts:
+                    os.unlink(entry.path)
     except Exception as e:
         log.error("contract cache remove error | {}".format(e))
 
 
+def read_contract_version(contract_path: Path) -> str:
+    """read the server contracts version stored beside the cache file"""
+    try:
+        return contract_path.with_suffix(".ver").read_text().strip()
+    except OSError:
+        return ""
+
+
+def write_contract_version(contract_path: Path, contracts_version: str):
+    try:
+        contract_path.with_suffix(".ver").write_text(contracts_version)
+    except OSError as e:
+        log.error("contract version write error | {}".format(e))
+
+
 def check_contract_cache(contract_path: Path) -> bool:
     """check contract cache exists and is up-to-date.
     Contracts will be update at 8 am and 2 pm.
     Returns:
         bool: True if cache exists and is up-to-date, else False.
     """
-    if contract_path.exists():
-        contract_file_datetime = dt.datetime.utcfromtimestamp(
-            contract_path.stat().st_mtime
-        )
-        utcnow = dt.datetime.utcnow()
-        if utcnow.date() > contract_file_datetime.date():
-            return False
-        elif utcnow.hour >= 6:
-            if contract_file_datetime.hour < 6:
-                return False
-        return True
-    else:
+    try:
+        mtime = os.stat(contract_path).st_mtime
+    except OSError:
         return False
+    # bucket raw timestamps to UTC day / second-of-day instead of building
+    # two datetime objects; 21600 is the 06:00 UTC refresh cut
+    utcnow = time.time()
+    if utcnow // 86400 > mtime // 86400:
+        return False
+    elif utcnow % 86400 >= 21600:
+        if mtime % 86400 < 21600:
+            return False
+    return True